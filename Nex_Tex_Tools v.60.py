@@ -7,26 +7,93 @@ A utility for processing video game textures with various operations.
 # IMPORTS SECTION
 #==============================================================================
 import os
+import stat
 import sys
 import shutil
 from pathlib import Path
-from PIL import Image
-from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from functools import lru_cache, partial
 import tkinter as tk
 from tkinter import filedialog, ttk, messagebox
 import threading
 import queue
+import logging
 import time
 import webbrowser
 
+# Tool functions report through this logger instead of print(); the GUI
+# attaches a handler that forwards records to the output pane, so no
+# builtins.print monkey-patching is needed to capture tool output
+log = logging.getLogger("nex_tex_tools")
+
+# Pillow, NumPy and (optionally) numba together add hundreds of ms of
+# import time before the window can paint, so they are resolved lazily
+# by _load_imaging() on the first call into an image-processing function
+Image = None
+np = None
+HAS_NUMBA = False
+
+def _load_imaging():
+    """
+    Import the heavy imaging dependencies on first use.
+    Numba is optional; when present the per-pixel remap compiles to
+    native code with the GIL released, otherwise plain NumPy is used.
+    Idempotent and cheap after the first call, so every image-touching
+    function can invoke it unconditionally (worker processes re-import
+    this module and take the same path).
+    """
+    global Image, np, HAS_NUMBA, _remap_alpha
+    if Image is not None:
+        return
+    from PIL import Image as _pil_image
+    import numpy as _np
+    np = _np
+    try:
+        from numba import njit, prange
+        HAS_NUMBA = True
+    except ImportError:
+        HAS_NUMBA = False
+    if HAS_NUMBA:
+        @njit(parallel=True, cache=True)
+        def _remap_alpha(buf, from_val, to_val):
+            """Rewrite alpha bytes equal to from_val in a flat RGBA buffer"""
+            for i in prange(buf.size // 4):
+                if buf[i * 4 + 3] == from_val:
+                    buf[i * 4 + 3] = to_val
+    # Without numba there is no _remap_alpha: the plain path in
+    # process_alpha uses a PIL point() LUT instead
+    # Assign Image last: it doubles as the "already loaded" flag
+    Image = _pil_image
+
 #==============================================================================
 # CONSTANTS AND CONFIGURATION
 #==============================================================================
 # Application version
 VERSION = "0.6.0"
 
-# Create a queue for thread communication
-output_queue = queue.Queue()
+# Message channel from worker threads to the GUI. A deque is enough
+# here: append/popleft are atomic on CPython, the Tk side drains rather
+# than blocks, and skipping queue.Queue's lock and unfinished-task
+# bookkeeping keeps high-volume progress streams cheap
+output_queue = deque()
+
+# Installed by the GUI: wakes the Tk event loop after a message is
+# queued so output appears immediately instead of on the next poll
+_wake_ui = None
+
+# Set when the GUI window closes. Pool threads are non-daemon, so the
+# interpreter would otherwise join a batch still in flight and keep a
+# headless process grinding through the remaining files; the batch
+# loops check this between files and wind down instead
+cancel_event = threading.Event()
+
+def _post(message_type, message=None):
+    """Queue a message for the GUI and wake the Tk loop if one is attached"""
+    output_queue.append((message_type, message))
+    wake = _wake_ui
+    if wake is not None:
+        wake()
 
 # Theme colors
 THEME_BG = "#151e21"  # Darker gray/teal (25% darker than before)
@@ -34,6 +101,13 @@ THEME_FG = "#ffffff"  # White text
 THEME_ACCENT = "#2a4c54"  # Slightly lighter teal for accents
 THEME_HIGHLIGHT = "#3e7783"  # Highlight color for buttons, etc.
 
+# PNG zlib level for re-encoded textures. The default (6) is ~4x slower
+# than 1 for marginal size gains on texture data
+PNG_COMPRESS_LEVEL = 1
+
+# Oldest lines are trimmed from the output pane beyond this count
+MAX_OUTPUT_LINES = 2000
+
 # Ko-fi donation URL
 DONATION_URL = "https://ko-fi.com/RomRevival"  
 
@@ -136,132 +210,381 @@ Required:
 #==============================================================================
 # UTILITY FUNCTIONS
 #==============================================================================
+@lru_cache(maxsize=64)
+def _resolve_dir(path):
+    """Memoized expanduser/abspath resolution for user-entered paths"""
+    return os.path.abspath(os.path.expanduser(path))
+
 def validate_directory(path, create=False):
-    """Validates that a directory exists or creates it if requested"""
-    path = os.path.expanduser(path)
-    path = os.path.abspath(path)
-    if create:
-        if not os.path.exists(path):
+    """
+    Validates that a directory exists or creates it if requested
+    One os.stat answers both the exists and is-directory questions.
+    Only the string resolution is memoized; the stat runs every call so
+    a path the user fixes mid-session (creates the directory, removes a
+    same-named file) validates on the next run instead of replaying a
+    cached failure.
+    """
+    path = _resolve_dir(path)
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        if create:
             try:
                 os.makedirs(path)
-                print(f"Created directory: {path}")
+                log.info(f"Created directory: {path}")
                 return path
             except Exception as e:
-                print(f"Error creating directory {path}: {e}")
+                log.info(f"Error creating directory {path}: {e}")
                 return None
-    if not os.path.exists(path):
-        print(f"Error: Directory does not exist: {path}")
+        log.info(f"Error: Directory does not exist: {path}")
         return None
-    if not os.path.isdir(path):
-        print(f"Error: Path is not a directory: {path}")
+    if not stat.S_ISDIR(st.st_mode):
+        log.info(f"Error: Path is not a directory: {path}")
         return None
     return path
 
+def _list_pngs(directory):
+    """
+    List PNG files in a directory as (name, path) pairs.
+    Uses os.scandir so the is_file() check comes from the cached DirEntry
+    instead of a separate stat call per file. On POSIX the entries are
+    sorted by inode, which approximates on-disk layout so batch reads
+    ride the filesystem's read-ahead instead of seeking in name order.
+    """
+    entries = [e for e in os.scandir(directory)
+               if e.is_file() and e.name.lower().endswith('.png')]
+    if os.name == 'posix':
+        entries.sort(key=lambda e: e.inode())
+    return [(e.name, e.path) for e in entries]
+
+def _run_with_progress(executor, fn, items):
+    """
+    Submit items to the executor and collect results as they complete,
+    pushing a PROGRESS update to the GUI every 64 finished files.
+    executor.map would block with no feedback until the whole batch is
+    done; as_completed lets the progress bar track long runs.
+    """
+    futures = [executor.submit(fn, item) for item in items]
+    results = []
+    for done, future in enumerate(as_completed(futures), 1):
+        if cancel_event.is_set():
+            for f in futures:
+                f.cancel()
+            break
+        results.append(future.result())
+        if done % 64 == 0:
+            _post('PROGRESS', 100 * done / len(futures))
+    return results
+
+def _fast_move(src, dst):
+    """
+    Move a file via hardlink-then-unlink when possible.
+    On the same filesystem this is two directory-entry operations that
+    cost the same for a 4 KB sprite and a 400 MB atlas, and unlike a
+    bare rename the source is only removed once the new link exists.
+    Falls back to shutil.move across filesystems (or when the
+    destination already exists, since link refuses to overwrite).
+    """
+    try:
+        os.link(src, dst)
+        os.unlink(src)
+    except OSError:
+        shutil.move(src, dst)
+
 def has_alpha(image_path):
     """Checks if an image has transparency (alpha channel)"""
+    _load_imaging()
     try:
         with Image.open(image_path) as img:
-            if img.mode == 'RGBA':
-                extrema = img.getextrema()
-                if len(extrema) == 4:
-                    return extrema[3][0] < 255
-            return False
+            # The mode comes from the PNG header, so plain RGB/greyscale
+            # files are settled without decompressing any pixel data, and
+            # palette images only need their tRNS transparency entry
+            if img.mode in ('RGB', 'L', '1'):
+                return False
+            if img.mode == 'P':
+                return 'transparency' in img.info
+            if 'A' not in img.getbands():
+                return False
+            # Only the alpha minimum matters; scanning just that band avoids
+            # the 4-channel min/max pass getextrema() does on the full image
+            return img.getchannel('A').getextrema()[0] < 255
     except Exception as e:
-        print(f"Error processing {image_path}: {e}")
+        log.info(f"Error processing {image_path}: {e}")
         return False
 
-def process_directory_batch(input_dir, process_func, **kwargs):
-    """Process all PNG files in a directory using the specified function"""
+def process_directory_batch(input_dir, process_func, cpu_bound=False,
+                            pipelined=False, **kwargs):
+    """
+    Process all PNG files in a directory using the specified function
+    cpu_bound=True runs workers in separate processes, which is what the
+    pixel-mutating tools need since threads share the GIL for that work;
+    I/O-bound tools (move/copy/delete) should keep the default threads.
+    pipelined=True instead runs a decode/transform/encode pipeline; in
+    that mode process_func must be an in-place array transform such as
+    alpha_remap_array or fill_array (see _process_pipelined).
+    """
     input_dir = validate_directory(input_dir)
     if not input_dir:
         return False
-    png_files = [os.path.join(input_dir, f) for f in os.listdir(input_dir) 
-                if f.lower().endswith('.png')]
+    png_files = [path for _, path in _list_pngs(input_dir)]
     if not png_files:
-        print(f"\nNo PNG files found in {input_dir}")
+        log.info(f"\nNo PNG files found in {input_dir}")
         return False
-    processed = 0
-    errors = 0
-    with ThreadPoolExecutor(max_workers=8) as executor:
-        futures = [executor.submit(process_func, f, **kwargs) for f in png_files]
-        for future in futures:
-            if future.result():
-                processed += 1
-            else:
+    if pipelined:
+        processed, errors = _process_pipelined(png_files, process_func, **kwargs)
+    elif cpu_bound:
+        workers = os.cpu_count() or 1
+        # Chunk submissions so per-file IPC doesn't eat the multicore win
+        chunksize = max(1, len(png_files) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            worker = partial(process_func, **kwargs)
+            results = []
+            for result in executor.map(worker, png_files, chunksize=chunksize):
+                results.append(result)
+                if cancel_event.is_set():
+                    # Drop the chunks not yet started so the with-block
+                    # join returns as soon as the running ones finish
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
+        # log.info in a worker process never reaches the GUI handler, so
+        # workers hand their error text back as (filename, error) results
+        # and the parent logs them here
+        errors = 0
+        for filename, error in results:
+            if error:
+                log.info(f"Error processing {filename}: {error}")
                 errors += 1
-    print(f"\nProcessing complete!")
-    print(f"Total files processed: {processed}")
-    print(f"Files with errors: {errors}")
+        processed = len(results) - errors
+    else:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = _run_with_progress(executor, partial(process_func, **kwargs),
+                                         png_files)
+        processed = sum(1 for r in results if r)
+        errors = len(results) - processed
+    log.info(f"\nProcessing complete!")
+    log.info(f"Total files processed: {processed}")
+    log.info(f"Files with errors: {errors}")
     return True
 
 #==============================================================================
 # IMAGE PROCESSING FUNCTIONS - CORE OPERATIONS
 #==============================================================================
+@lru_cache(maxsize=16)
+def _pack_rgba(color_rgb):
+    """
+    Pack an RGBA tuple into the uint32 value of one pixel in PIL's
+    little-endian RGBA layout. Memoized so the shifts and the tuple
+    indexing run once per batch color, not once per file.
+    """
+    r, g, b, a = color_rgb
+    return np.uint32(r | (g << 8) | (b << 16) | (a << 24))
+
+def alpha_remap_array(arr, make_solid=True):
+    """
+    In-place alpha remap on an RGBA array (pipeline transform stage)
+    Returns True if any pixel changed, so the caller can skip re-encoding.
+    """
+    _load_imaging()
+    from_val, to_val = (128, 255) if make_solid else (255, 128)
+    # arr[..., 3] is a stride-4 view; copying it to a contiguous plane
+    # trades one copy for compare and assignment passes over unbroken
+    # memory, then the remapped plane is written back in one pass
+    alpha = np.ascontiguousarray(arr[..., 3])
+    mask = alpha == from_val
+    if not mask.any():
+        return False
+    alpha[mask] = to_val
+    arr[..., 3] = alpha
+    return True
+
+def fill_array(arr, color_rgb, restore=False):
+    """
+    In-place transparency fill/restore on an RGBA array (pipeline
+    transform stage). Returns True if any pixel changed.
+    """
+    _load_imaging()
+    flat = arr.view(np.uint32).reshape(-1)
+    packed = _pack_rgba(tuple(color_rgb))
+    if not restore:
+        mask = (arr[..., 3] == 0).reshape(-1)
+        value = packed
+    else:
+        mask = flat == packed
+        value = 0
+    if not mask.any():
+        return False
+    flat[mask] = value
+    return True
+
+def _process_pipelined(png_files, transform, **kwargs):
+    """
+    Run an array transform over files as a 3-stage pipeline:
+    decoder threads feed decoded RGBA arrays through a bounded queue to
+    transform workers, whose changed arrays flow through a second
+    bounded queue to encoder threads. Decode, pixel work and PNG
+    re-encode overlap instead of running back-to-back per file, and the
+    queue bounds cap how many decoded images sit in memory at once.
+    `transform` is an in-place array function such as alpha_remap_array
+    or fill_array that returns True when the file needs re-encoding.
+    """
+    _load_imaging()
+    workers = max(2, (os.cpu_count() or 2) // 2)
+    decode_q = queue.Queue(maxsize=2 * workers)
+    encode_q = queue.Queue(maxsize=2 * workers)
+    counts = {'processed': 0, 'errors': 0}
+    counts_lock = threading.Lock()
+    path_iter = iter(png_files)
+    iter_lock = threading.Lock()
+
+    def _tally(key):
+        with counts_lock:
+            counts[key] += 1
+
+    def decoder():
+        while not cancel_event.is_set():
+            with iter_lock:
+                path = next(path_iter, None)
+            if path is None:
+                return
+            try:
+                with Image.open(path) as img:
+                    if img.mode != 'RGBA':
+                        _tally('processed')
+                        continue
+                    arr = np.array(img, copy=True)
+                decode_q.put((path, arr))
+            except Exception as e:
+                log.info(f"Error processing {path}: {e}")
+                _tally('errors')
+
+    def transformer():
+        while True:
+            item = decode_q.get()
+            if item is None:
+                return
+            path, arr = item
+            try:
+                if transform(arr, **kwargs):
+                    encode_q.put((path, arr))
+                else:
+                    _tally('processed')
+            except Exception as e:
+                log.info(f"Error processing {path}: {e}")
+                _tally('errors')
+
+    def encoder():
+        while True:
+            item = encode_q.get()
+            if item is None:
+                return
+            path, arr = item
+            try:
+                Image.fromarray(arr, 'RGBA').save(path, 'PNG',
+                                                  compress_level=PNG_COMPRESS_LEVEL)
+                _tally('processed')
+            except Exception as e:
+                log.info(f"Error processing {path}: {e}")
+                _tally('errors')
+
+    stages = ([threading.Thread(target=decoder) for _ in range(workers)],
+              [threading.Thread(target=transformer) for _ in range(workers)],
+              [threading.Thread(target=encoder) for _ in range(workers)])
+    for stage in stages:
+        for t in stage:
+            t.start()
+    for t in stages[0]:
+        t.join()
+    for _ in stages[1]:
+        decode_q.put(None)
+    for t in stages[1]:
+        t.join()
+    for _ in stages[2]:
+        encode_q.put(None)
+    for t in stages[2]:
+        t.join()
+    return counts['processed'], counts['errors']
+
 def process_alpha(image_path, make_solid=True):
     """
     Process alpha channel in an image
     If make_solid=True: Change alpha 128 to 255 (make semi-transparent solid)
     If make_solid=False: Change alpha 255 to 128 (make solid semi-transparent)
+    Runs in a worker process, so errors come back as (filename, error)
+    for the parent to log rather than being logged here.
     """
+    _load_imaging()
+    filename = os.path.basename(image_path)
     try:
         with Image.open(image_path) as img:
             if img.mode != 'RGBA':
-                return
-            data = list(img.getdata())
-            new_data = []
-            for r, g, b, a in data:
-                if a == 0:
-                    new_data.append((r, g, b, 0))
-                elif make_solid and a == 128:
-                    new_data.append((r, g, b, 255))
-                elif not make_solid and a == 255:
-                    new_data.append((r, g, b, 128))
-                else:
-                    new_data.append((r, g, b, a))
-            img.putdata(new_data)
-            img.save(image_path, 'PNG')
-            return True
+                return (filename, None)
+            from_val, to_val = (128, 255) if make_solid else (255, 128)
+            # PNG re-encode (Deflate) is the expensive step; skip it
+            # entirely when no pixel carries the alpha value we'd rewrite
+            if img.getchannel('A').histogram()[from_val] == 0:
+                return (filename, None)
+            if HAS_NUMBA:
+                # Compiled remap over the raw buffer, GIL released
+                arr = np.array(img)
+                _remap_alpha(arr.ravel(), from_val, to_val)
+                Image.fromarray(arr, 'RGBA').save(image_path, 'PNG',
+                                                  compress_level=PNG_COMPRESS_LEVEL)
+            else:
+                # point() applies a 256-entry LUT to the alpha band in a
+                # tight C loop (SIMD-accelerated under Pillow-SIMD), with
+                # no round-trip through a NumPy copy of the whole image
+                lut = list(range(256))
+                lut[from_val] = to_val
+                img.putalpha(img.getchannel('A').point(lut))
+                img.save(image_path, 'PNG', compress_level=PNG_COMPRESS_LEVEL)
+            return (filename, None)
     except Exception as e:
-        print(f"Error processing {image_path}: {e}")
-        return False
+        return (filename, str(e))
 
 def fill_transparency(image_path, color_rgb, restore=False):
     """
     Fill transparent pixels with color or restore transparency
     If restore=False: Fill transparent pixels (alpha=0) with the specified color
     If restore=True: Change pixels of the specified color back to transparent
+    Runs in a worker process, so errors come back as (filename, error)
+    for the parent to log rather than being logged here.
     """
+    _load_imaging()
+    filename = os.path.basename(image_path)
     try:
         with Image.open(image_path) as img:
             if img.mode != 'RGBA':
-                return
-            data = list(img.getdata())
-            new_data = []
+                return (filename, None)
+            if not restore and img.getchannel('A').histogram()[0] == 0:
+                # No fully transparent pixels: nothing to fill, and
+                # skipping the save avoids a pointless PNG re-encode
+                return (filename, None)
+            # View each RGBA pixel as one uint32 so fill/restore is a single
+            # vectorized compare-and-store instead of a Python tuple loop
+            arr = np.array(img)
+            flat = arr.view(np.uint32).reshape(-1)
+            packed = _pack_rgba(tuple(color_rgb))
             if not restore:
-                for r, g, b, a in data:
-                    if a == 0:
-                        new_data.append(color_rgb)
-                    else:
-                        new_data.append((r, g, b, a))
+                flat[(arr[..., 3] == 0).reshape(-1)] = packed
             else:
-                for r, g, b, a in data:
-                    if (r, g, b, a) == color_rgb:
-                        new_data.append((0, 0, 0, 0))
-                    else:
-                        new_data.append((r, g, b, a))
-            img.putdata(new_data)
-            img.save(image_path, 'PNG')
-            return True
+                mask = flat == packed
+                if not mask.any():
+                    return (filename, None)
+                flat[mask] = 0
+            Image.fromarray(arr, 'RGBA').save(image_path, 'PNG',
+                                              compress_level=PNG_COMPRESS_LEVEL)
+            return (filename, None)
     except Exception as e:
-        print(f"Error processing {image_path}: {e}")
-        return False
+        return (filename, str(e))
 
 #==============================================================================
 # IMAGE PROCESSING FUNCTIONS - TOOL 1: MOVE ALPHA PNGS
 #==============================================================================
-def move_alpha_pngs(source_dir, destination_dir):
+def move_alpha_pngs(source_dir, destination_dir, verbose=False):
     """
     Move all PNG files with alpha channel from source to destination directory
+    Workers return per-file status tuples; printing happens once at the end
+    so thousands of files don't serialize the pool on the stdout lock.
     """
     source_dir = validate_directory(source_dir)
     if not source_dir:
@@ -269,37 +592,42 @@ def move_alpha_pngs(source_dir, destination_dir):
     destination_dir = validate_directory(destination_dir, create=True)
     if not destination_dir:
         return False
-    total_files = 0
-    moved_files = 0
-    error_files = 0
     try:
-        png_files = [f for f in os.listdir(source_dir) if f.lower().endswith('.png')]
+        png_files = _list_pngs(source_dir)
         if not png_files:
-            print(f"\nNo PNG files found in {source_dir}")
+            log.info(f"\nNo PNG files found in {source_dir}")
             return False
+
+        def check_and_move(item):
+            filename, file_path = item
+            try:
+                if has_alpha(file_path):
+                    _fast_move(file_path, os.path.join(destination_dir, filename))
+                    return (filename, 'moved')
+                return (filename, 'skipped')
+            except Exception as e:
+                return (filename, f'error: {e}')
+
         with ThreadPoolExecutor(max_workers=8) as executor:
-            for filename in png_files:
-                total_files += 1
-                file_path = os.path.join(source_dir, filename)
-                try:
-                    if has_alpha(file_path):
-                        dest_path = os.path.join(destination_dir, filename)
-                        shutil.move(file_path, dest_path)
-                        print(f"Moved {filename} to {destination_dir}")
-                        moved_files += 1
-                    else:
-                        print(f"Skipped {filename} (no alpha channel)")
-                except Exception as e:
-                    print(f"Error processing {filename}: {e}")
-                    error_files += 1
-        print(f"\nSummary:")
-        print(f"Total PNG files found: {total_files}")
-        print(f"Files moved (with alpha): {moved_files}")
-        print(f"Files skipped (without alpha): {total_files - moved_files - error_files}")
-        print(f"Files with errors: {error_files}")
+            results = _run_with_progress(executor, check_and_move, png_files)
+        total_files = len(results)
+        moved_files = sum(1 for _, status in results if status == 'moved')
+        error_files = sum(1 for _, status in results if status.startswith('error'))
+        if verbose:
+            for filename, status in results:
+                log.info(f"{filename}: {status}")
+        else:
+            for filename, status in results:
+                if status.startswith('error'):
+                    log.info(f"Error processing {filename}: {status[7:]}")
+        log.info(f"\nSummary:")
+        log.info(f"Total PNG files found: {total_files}")
+        log.info(f"Files moved (with alpha): {moved_files}")
+        log.info(f"Files skipped (without alpha): {total_files - moved_files - error_files}")
+        log.info(f"Files with errors: {error_files}")
         return True
     except Exception as e:
-        print(f"\nAn error occurred: {e}")
+        log.info(f"\nAn error occurred: {e}")
         return False
 
 #==============================================================================
@@ -309,26 +637,39 @@ def flip_images(folder_path):
     """
     Flip all PNG images in the folder vertically (top to bottom)
     """
+    _load_imaging()
     if not os.path.exists(folder_path):
-        print(f"Error: Folder '{folder_path}' not found")
+        log.info(f"Error: Folder '{folder_path}' not found")
         return
-    png_files = [os.path.join(folder_path, f) for f in os.listdir(folder_path) 
-                if f.lower().endswith('.png')]
+    png_files = [path for _, path in _list_pngs(folder_path)]
     if not png_files:
-        print("No PNG files found in the folder")
+        log.info("No PNG files found in the folder")
         return
     with ThreadPoolExecutor(max_workers=8) as executor:
         def flip_single(filepath):
             try:
                 with Image.open(filepath) as img:
-                    flipped_img = img.transpose(Image.FLIP_TOP_BOTTOM)
+                    if (img.mode in ('RGB', 'RGBA')
+                            and img.width * img.height > 1_000_000):
+                        # For 2K+ textures one reversed-row copy into a
+                        # contiguous buffer beats PIL's transpose row loop;
+                        # tiny sprites stay on the cheaper C path below.
+                        # Only for RGB/RGBA: fromarray on a P or LA array
+                        # would guess the wrong mode and drop the palette
+                        arr = np.asarray(img)
+                        flipped_img = Image.fromarray(arr[::-1].copy())
+                    else:
+                        flipped_img = img.transpose(Image.FLIP_TOP_BOTTOM)
                     flipped_img.save(filepath)
-                print(f"Flipped: {os.path.basename(filepath)}")
-                return True
+                return (os.path.basename(filepath), None)
             except Exception as e:
-                print(f"Error processing {os.path.basename(filepath)}: {str(e)}")
-                return False
-        list(executor.map(flip_single, png_files))
+                return (os.path.basename(filepath), str(e))
+        results = _run_with_progress(executor, flip_single, png_files)
+    flipped = sum(1 for _, error in results if error is None)
+    for filename, error in results:
+        if error:
+            log.info(f"Error processing {filename}: {error}")
+    log.info(f"Flipped {flipped} of {len(results)} PNG files")
 
 #==============================================================================
 # IMAGE PROCESSING FUNCTIONS - TOOL 3: REMOVE DUPLICATE FILES
@@ -347,52 +688,72 @@ def list_duplicate_files(source_dir, dest_dir):
 def process_single_image(args):
     """
     Helper function for detect_ps2_alpha - processes a single image
+    Runs in a worker process, so the outcome (and any error text) comes
+    back as a (filename, status) tuple for the parent to log.
     """
+    _load_imaging()
     file_path, output_dir = args
+    filename = os.path.basename(file_path)
     try:
         with Image.open(file_path) as img:
             if img.mode != 'RGBA':
-                return None
-            alpha = img.split()[3]
-            alpha_values = set(alpha.getdata())
-            if any(x != 128 for x in alpha_values):
-                filename = os.path.basename(file_path)
+                return (filename, 'skipped')
+            # getextrema() on the alpha band is one tight C scan inside
+            # libImaging and settles the question outright: a band whose
+            # min and max are both 128 is the uniform PS2 half-alpha case
+            # and stays put; anything else has variable alpha and moves
+            lo, hi = img.getchannel('A').getextrema()
+            if lo != 128 or hi != 128:
                 dest_path = os.path.join(output_dir, filename)
-                shutil.move(file_path, dest_path)
-                return filename
+                _fast_move(file_path, dest_path)
+                return (filename, 'moved')
     except Exception as e:
-        print(f"Error processing {file_path}: {e}")
-    return None
+        return (filename, f'error: {e}')
+    return (filename, 'skipped')
 
-def detect_ps2_alpha(input_dir, output_dir):
+def detect_ps2_alpha(input_dir, output_dir, verbose=False):
     """
     Detect PS2 textures with variable alpha values and move them
     """
-    print("\nStarting PS2 texture detection with multi-threading...")
+    log.info("\nStarting PS2 texture detection with multi-core processing...")
     input_dir = validate_directory(input_dir)
     if not input_dir:
         return False
     output_dir = validate_directory(output_dir, create=True)
     if not output_dir:
         return False
-    png_files = [os.path.join(input_dir, f) for f in os.listdir(input_dir) 
-                if f.lower().endswith('.png')]
+    png_files = [path for _, path in _list_pngs(input_dir)]
     if not png_files:
-        print(f"\nNo PNG files found in {input_dir}")
+        log.info(f"\nNo PNG files found in {input_dir}")
         return False
     total_files = len(png_files)
-    print(f"\nFound {total_files} PNG files to process...")
+    log.info(f"\nFound {total_files} PNG files to process...")
     work_items = [(f, output_dir) for f in png_files]
     moved_files = 0
-    with ThreadPoolExecutor(max_workers=8) as executor:
-        results = list(executor.map(process_single_image, work_items))
-        moved_files = sum(1 for r in results if r is not None)
-        for filename in (r for r in results if r is not None):
-            print(f"Moved shaped texture: {filename}")
-    print(f"\nProcessing complete!")
-    print(f"Total PNG files processed: {total_files}")
-    print(f"Files moved (with variable alpha): {moved_files}")
-    print(f"Files skipped: {total_files - moved_files}")
+    # The alpha scan is CPU-bound, so use processes for real multicore speedup
+    workers = os.cpu_count() or 1
+    chunksize = max(1, len(work_items) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = []
+        for result in executor.map(process_single_image, work_items, chunksize=chunksize):
+            results.append(result)
+            if cancel_event.is_set():
+                executor.shutdown(wait=False, cancel_futures=True)
+                break
+    moved_files = sum(1 for _, status in results if status == 'moved')
+    error_files = sum(1 for _, status in results if status.startswith('error'))
+    for filename, status in results:
+        if status.startswith('error'):
+            log.info(f"Error processing {filename}: {status[7:]}")
+    if verbose:
+        for filename, status in results:
+            if status == 'moved':
+                log.info(f"Moved shaped texture: {filename}")
+    log.info(f"\nProcessing complete!")
+    log.info(f"Total PNG files processed: {total_files}")
+    log.info(f"Files moved (with variable alpha): {moved_files}")
+    log.info(f"Files skipped: {total_files - moved_files - error_files}")
+    log.info(f"Files with errors: {error_files}")
     return True
 
 #==============================================================================
@@ -410,58 +771,54 @@ def find_and_replace(source_dir, dest_dir):
     if not dest_dir:
         return False
     
-    # Get list of PNG files in source directory (new dump)
-    source_files = [f for f in os.listdir(source_dir) 
-                   if f.lower().endswith('.png') and os.path.isfile(os.path.join(source_dir, f))]
-    
-    total_files = len(source_files)
-    if not source_files:
-        print(f"\nNo PNG files found in source directory {source_dir}")
+    # PNG filenames in source directory (new dump)
+    source_names = frozenset(name for name, _ in _list_pngs(source_dir))
+
+    total_files = len(source_names)
+    if not source_names:
+        log.info(f"\nNo PNG files found in source directory {source_dir}")
         return False
-    
-    # Get set of filenames that already exist in destination directory (old dump)
-    existing_files = set(f for f in os.listdir(dest_dir) 
-                      if f.lower().endswith('.png') and os.path.isfile(os.path.join(dest_dir, f)))
-    
-    print(f"\nFound {total_files} PNG files in source directory...")
-    print(f"Found {len(existing_files)} PNG files in destination directory...")
-    
-    # Find new files (in source but not in destination)
-    new_files = [f for f in source_files if f not in existing_files]
-    print(f"Found {len(new_files)} new files to copy...")
+
+    # Filenames that already exist in destination directory (old dump)
+    existing_names = frozenset(name for name, _ in _list_pngs(dest_dir))
+
+    log.info(f"\nFound {total_files} PNG files in source directory...")
+    log.info(f"Found {len(existing_names)} PNG files in destination directory...")
+
+    # Find new files (in source but not in destination) in one hashed pass
+    new_files = sorted(source_names - existing_names)
+    log.info(f"Found {len(new_files)} new files to copy...")
     
     if not new_files:
-        print("No new files to copy. Operation complete!")
+        log.info("No new files to copy. Operation complete!")
         return True
     
-    copied_files = 0
-    error_files = 0
-    
     with ThreadPoolExecutor(max_workers=8) as executor:
         def copy_file(filename):
             try:
                 source_path = os.path.join(source_dir, filename)
                 dest_path = os.path.join(dest_dir, filename)
                 
-                # Copy the new file to destination
-                shutil.copy2(source_path, dest_path)
-                
-                print(f"Copied: {filename} (new file)")
-                return "copied"
+                # copyfile skips the copystat metadata pass; texture
+                # workflows don't care about preserved mtimes
+                shutil.copyfile(source_path, dest_path)
+                return (filename, None)
             except Exception as e:
-                print(f"Error processing {filename}: {e}")
-                return "error"
-        
-        results = list(executor.map(copy_file, new_files))
-        
-    copied_files = sum(1 for r in results if r == "copied")
-    error_files = sum(1 for r in results if r == "error")
+                return (filename, str(e))
+
+        results = _run_with_progress(executor, copy_file, new_files)
+
+    copied_files = sum(1 for _, error in results if error is None)
+    error_files = len(results) - copied_files
+    for filename, error in results:
+        if error:
+            log.info(f"Error processing {filename}: {error}")
     
-    print(f"\nOperation complete!")
-    print(f"Total files in source: {total_files}")
-    print(f"New files found: {len(new_files)}")
-    print(f"Files copied: {copied_files}")
-    print(f"Files with errors: {error_files}")
+    log.info(f"\nOperation complete!")
+    log.info(f"Total files in source: {total_files}")
+    log.info(f"New files found: {len(new_files)}")
+    log.info(f"Files copied: {copied_files}")
+    log.info(f"Files with errors: {error_files}")
     
     return True
 
@@ -478,42 +835,36 @@ def remove_bkp_files(directory):
         return False
     
     # Get list of PNG files in the directory that start with BKP_
-    bkp_files = [f for f in os.listdir(directory) 
-                if f.lower().endswith('.png') and f.startswith('BKP_') and os.path.isfile(os.path.join(directory, f))]
+    bkp_files = [name for name, _ in _list_pngs(directory) if name.startswith('BKP_')]
     
     total_bkp_files = len(bkp_files)
     if not bkp_files:
-        print(f"\nNo BKP_ PNG files found in {directory}")
+        log.info(f"\nNo BKP_ PNG files found in {directory}")
         return False
     
-    print(f"\nFound {total_bkp_files} BKP_ PNG files to remove...")
-    
-    deleted_files = 0
-    error_files = 0
+    log.info(f"\nFound {total_bkp_files} BKP_ PNG files to remove...")
     
     with ThreadPoolExecutor(max_workers=8) as executor:
         def delete_file(filename):
             try:
                 file_path = os.path.join(directory, filename)
                 os.remove(file_path)
-                print(f"Deleted: {filename}")
-                return True
+                return (filename, None)
             except Exception as e:
-                print(f"Error deleting {filename}: {e}")
-                return False
-        
-        results = list(executor.map(delete_file, bkp_files))
-        
-        for result in results:
-            if result:
-                deleted_files += 1
-            else:
-                error_files += 1
+                return (filename, str(e))
+
+        results = _run_with_progress(executor, delete_file, bkp_files)
+
+    deleted_files = sum(1 for _, error in results if error is None)
+    error_files = len(results) - deleted_files
+    for filename, error in results:
+        if error:
+            log.info(f"Error deleting {filename}: {error}")
     
-    print(f"\nOperation complete!")
-    print(f"Total BKP_ PNG files found: {total_bkp_files}")
-    print(f"Files deleted: {deleted_files}")
-    print(f"Files with errors: {error_files}")
+    log.info(f"\nOperation complete!")
+    log.info(f"Total BKP_ PNG files found: {total_bkp_files}")
+    log.info(f"Files deleted: {deleted_files}")
+    log.info(f"Files with errors: {error_files}")
     
     return True
 
@@ -533,38 +884,33 @@ def compare_and_move(source_dir, dest_dir):
     if not dest_dir:
         return False
     
-    # Get list of PNG files in source directory (upscaled images)
-    source_files = {f: os.path.join(source_dir, f) for f in os.listdir(source_dir) 
-                   if f.lower().endswith('.png') and os.path.isfile(os.path.join(source_dir, f))}
-    
-    # Get list of PNG files in destination directory (new dump)
-    dest_files = {f: os.path.join(dest_dir, f) for f in os.listdir(dest_dir) 
-                 if f.lower().endswith('.png') and os.path.isfile(os.path.join(dest_dir, f))}
-    
-    total_source = len(source_files)
-    total_dest = len(dest_files)
-    
-    if not source_files:
-        print(f"\nNo PNG files found in source directory {source_dir}")
+    # PNG filenames in source directory (upscaled images)
+    source_names = frozenset(name for name, _ in _list_pngs(source_dir))
+
+    # PNG filenames in destination directory (new dump)
+    dest_names = frozenset(name for name, _ in _list_pngs(dest_dir))
+
+    total_source = len(source_names)
+    total_dest = len(dest_names)
+
+    if not source_names:
+        log.info(f"\nNo PNG files found in source directory {source_dir}")
         return False
-    if not dest_files:
-        print(f"\nNo PNG files found in destination directory {dest_dir}")
+    if not dest_names:
+        log.info(f"\nNo PNG files found in destination directory {dest_dir}")
         return False
-    
-    print(f"\nFound {total_source} PNG files in source directory (upscaled images)...")
-    print(f"Found {total_dest} PNG files in destination directory (new dump)...")
-    
-    # Find matching files (in both source and destination)
-    matching_files = [f for f in dest_files if f in source_files]
-    print(f"Found {len(matching_files)} matching files to replace...")
+
+    log.info(f"\nFound {total_source} PNG files in source directory (upscaled images)...")
+    log.info(f"Found {total_dest} PNG files in destination directory (new dump)...")
+
+    # Find matching files (in both source and destination) via set intersection
+    matching_files = sorted(source_names & dest_names)
+    log.info(f"Found {len(matching_files)} matching files to replace...")
     
     if not matching_files:
-        print("No matching files to replace. Operation complete!")
+        log.info("No matching files to replace. Operation complete!")
         return True
     
-    copied_files = 0
-    error_files = 0
-    
     with ThreadPoolExecutor(max_workers=8) as executor:
         def copy_replace_file(filename):
             try:
@@ -572,25 +918,25 @@ def compare_and_move(source_dir, dest_dir):
                 dest_path = os.path.join(dest_dir, filename)
                 
                 # Copy the upscaled file to destination, overwriting the existing one
-                shutil.copy2(source_path, dest_path)
-                
-                print(f"Replaced: {filename}")
-                return "copied"
+                shutil.copyfile(source_path, dest_path)
+                return (filename, None)
             except Exception as e:
-                print(f"Error processing {filename}: {e}")
-                return "error"
-        
-        results = list(executor.map(copy_replace_file, matching_files))
-    
-    copied_files = sum(1 for r in results if r == "copied")
-    error_files = sum(1 for r in results if r == "error")
+                return (filename, str(e))
+
+        results = _run_with_progress(executor, copy_replace_file, matching_files)
+
+    copied_files = sum(1 for _, error in results if error is None)
+    error_files = len(results) - copied_files
+    for filename, error in results:
+        if error:
+            log.info(f"Error processing {filename}: {error}")
     
-    print(f"\nOperation complete!")
-    print(f"Total files in source: {total_source}")
-    print(f"Total files in destination: {total_dest}")
-    print(f"Matching files found: {len(matching_files)}")
-    print(f"Files replaced: {copied_files}")
-    print(f"Files with errors: {error_files}")
+    log.info(f"\nOperation complete!")
+    log.info(f"Total files in source: {total_source}")
+    log.info(f"Total files in destination: {total_dest}")
+    log.info(f"Matching files found: {len(matching_files)}")
+    log.info(f"Files replaced: {copied_files}")
+    log.info(f"Files with errors: {error_files}")
     
     return True
 
@@ -605,15 +951,96 @@ def compare_and_move(source_dir, dest_dir):
 #==============================================================================
 # TKINTER GUI CLASS
 #==============================================================================
+class _QueueHandler(logging.Handler):
+    """Forwards tool log records to the GUI output queue"""
+    def emit(self, record):
+        _post('INFO', record.getMessage())
+
+# Which input widgets each tool needs: s = source dir, d = dest dir,
+# c = fill color picker. Tools sharing a key share the same layout, so
+# update_display can skip the re-pack when switching between them, and
+# run_selected_tool uses the same table to decide which directories to
+# validate and pass
+_LAYOUTS = {
+    "1": "sd", "2": "s", "3": "sd", "4": "sd", "5": "s",
+    "6": "s", "7": "sc", "8": "sd", "9": "s", "10": "sd",
+}
+
+# What each tool runs, built once instead of rebuilding closures on
+# every click. Entries take the source dir (plus the dest dir when the
+# layout says so); tool 7's fill color is supplied as a keyword at call
+# time and tool 3 keeps its interactive dedup handler
+_DISPATCH = {
+    "1": move_alpha_pngs,
+    "2": flip_images,
+    "4": detect_ps2_alpha,
+    "5": partial(process_directory_batch, process_func=process_alpha,
+                 cpu_bound=True, make_solid=True),
+    "6": partial(process_directory_batch, process_func=process_alpha,
+                 cpu_bound=True, make_solid=False),
+    "7": partial(process_directory_batch, process_func=fill_transparency,
+                 cpu_bound=True, restore=False),
+    "8": find_and_replace,
+    "9": remove_bkp_files,
+    "10": compare_and_move,
+    # Add new tools here following the same pattern
+}
+
+def _configure_styles():
+    """Configure the shared ttk styles (once per Tk interpreter)"""
+    style = ttk.Style()
+    style.configure("Donation.TButton", font=("Helvetica", 10, "bold"))
+
 class ImageToolsApp:
     def __init__(self, root):
         self.root = root
         self.root.title(f"Nex Tex Tools v{VERSION}")
         self.root.geometry("900x700")
-        
+
         # Apply dark theme colors
         self.apply_theme()
-        
+
+        # Route tool logging into the output queue for this session
+        log.addHandler(_QueueHandler())
+        log.setLevel(logging.INFO)
+        log.propagate = False
+
+        # Messages printed before the output area exists are buffered
+        # here and flushed once _build_details has run
+        self._pending_output = []
+        self._out_lines = 0
+
+        # Layout class currently packed and tool currently displayed, so
+        # update_display can skip work that would change nothing
+        self._last_layout_key = None
+        self._cur_tool = None
+
+        # One shared pool for all long operations instead of a fresh
+        # thread per click; shut down (without waiting) on window close
+        self._executor = ThreadPoolExecutor(max_workers=os.cpu_count(),
+                                            thread_name_prefix="ntt")
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # True while a tool run is in flight; the Run button is disabled
+        # so a second click can't start a concurrent batch over the same
+        # files
+        self._busy = False
+
+        # Realize the window with just the core widgets (tool list,
+        # inputs, action buttons); the heavier detail panes are posted
+        # to the first idle tick so the window appears immediately
+        self._build_core(root)
+        self.root.after_idle(self._build_details)
+
+        # Workers wake the Tk loop with a virtual event as messages are
+        # queued; a slow background poll stays as a safety net
+        global _wake_ui
+        self.root.bind("<<NttOutput>>", lambda e: self._drain_output())
+        _wake_ui = self._wake
+        self.check_queue()
+
+    def _build_core(self, root):
+        """Build the minimal widget set needed to show the window"""
         # Create main frame with dark background
         self.main_frame = ttk.Frame(root, padding="10")
         self.main_frame.pack(fill=tk.BOTH, expand=True)
@@ -666,7 +1093,7 @@ class ImageToolsApp:
             # Add new tools here following the same pattern
         ]
         
-        for i, (text, value) in enumerate(tools):
+        for text, value in tools:
             ttk.Radiobutton(
                 tool_frame, 
                 text=text, 
@@ -678,16 +1105,7 @@ class ImageToolsApp:
         # Right panel - Tool details and inputs
         self.right_panel = ttk.Frame(self.horizontal_layout)
         self.right_panel.pack(side="right", fill="both", expand=True)
-        
-        # Tool description area
-        self.description_frame = ttk.LabelFrame(self.right_panel, text="Tool Description:")
-        self.description_frame.pack(fill="x", pady=5)
-        
-        self.description_text = tk.Text(self.description_frame, height=6, wrap="word", 
-                                   bg=THEME_ACCENT, fg=THEME_FG)
-        self.description_text.pack(fill="x", padx=5, pady=5)
-        self.description_text.config(state="disabled")
-        
+
         # Input options frame (removed title as requested)
         self.input_frame = ttk.Frame(self.right_panel)
         self.input_frame.pack(fill="x", pady=10)
@@ -720,15 +1138,55 @@ class ImageToolsApp:
             width=20
         )
         self.color_dropdown.pack(side="left", padx=5)
-        
+
+        # Map display names straight to fill RGBA values once, instead of
+        # rebuilding two lists and doing a linear index on every Run click
+        self._fill_color_lookup = {spec['name']: spec['rgb']
+                                   for spec in FILL_COLORS.values()}
+
+        # Action buttons
+        button_frame = ttk.Frame(self.right_panel)
+        button_frame.pack(fill="x", pady=10)
+        self._run_btn = ttk.Button(
+            button_frame,
+            text="Run Tool",
+            command=self.run_selected_tool
+        )
+        self._run_btn.pack(side="left", padx=5)
+        ttk.Button(
+            button_frame, 
+            text="About", 
+            command=self.show_about
+        ).pack(side="left", padx=5)
+        ttk.Button(
+            button_frame,
+            text="Exit",
+            command=self._on_close
+        ).pack(side="left", padx=5)
+
+        # Set initial state
+        self.update_display()
+
+    def _build_details(self):
+        """Build the heavier panes once the window is already visible"""
+        # Tool description area (packed above the input frame)
+        self.description_frame = ttk.LabelFrame(self.right_panel, text="Tool Description:")
+        self.description_frame.pack(fill="x", pady=5, before=self.input_frame)
+
+        # A read-only Label is far cheaper than a Text widget and updates
+        # with a single configure call per tool selection
+        self._desc_var = tk.StringVar()
+        self.description_label = ttk.Label(self.description_frame, textvariable=self._desc_var,
+                                      wraplength=500, justify="left")
+        self.description_label.pack(fill="x", padx=5, pady=5)
+
         # Add community buttons to the bottom of the left panel
         donation_frame = ttk.Frame(self.left_panel)
         donation_frame.pack(side="bottom", fill="x", pady=20)
-        
+
         # Style for all community buttons
-        style = ttk.Style()
-        style.configure("Donation.TButton", font=("Helvetica", 10, "bold"))
-        
+        _configure_styles()
+
         # Ko-fi button
         donation_button = ttk.Button(
             donation_frame,
@@ -737,7 +1195,7 @@ class ImageToolsApp:
             style="Donation.TButton"
         )
         donation_button.pack(fill="x", padx=10, pady=5)
-        
+
         # Discord button
         discord_button = ttk.Button(
             donation_frame,
@@ -746,7 +1204,7 @@ class ImageToolsApp:
             style="Donation.TButton"
         )
         discord_button.pack(fill="x", padx=10, pady=5)
-        
+
         # Reddit button
         reddit_button = ttk.Button(
             donation_frame,
@@ -755,51 +1213,34 @@ class ImageToolsApp:
             style="Donation.TButton"
         )
         reddit_button.pack(fill="x", padx=10, pady=5)
-        
-        # Action buttons
-        button_frame = ttk.Frame(self.right_panel)
-        button_frame.pack(fill="x", pady=10)
-        ttk.Button(
-            button_frame, 
-            text="Run Tool", 
-            command=self.run_selected_tool
-        ).pack(side="left", padx=5)
-        ttk.Button(
-            button_frame, 
-            text="About", 
-            command=self.show_about
-        ).pack(side="left", padx=5)
-        ttk.Button(
-            button_frame, 
-            text="Exit", 
-            command=root.destroy
-        ).pack(side="left", padx=5)
-        
+
         # Output area
         output_frame = ttk.LabelFrame(self.right_panel, text="Output:")
         output_frame.pack(fill="both", expand=True, pady=5)
-        
+
         self.output_text = tk.Text(output_frame, height=10, width=80, wrap="word",
                               bg=THEME_ACCENT, fg=THEME_FG)
         self.output_text.pack(fill="both", expand=True, side="left")
-        
+
         output_scrollbar = ttk.Scrollbar(output_frame, orient="vertical", command=self.output_text.yview)
         output_scrollbar.pack(side="right", fill="y")
         self.output_text.config(yscrollcommand=output_scrollbar.set)
         self.output_text.config(state="disabled")
-        
+
         # Progress bar
         self.progress_frame = ttk.Frame(self.right_panel)
         self.progress_frame.pack(fill="x", pady=5)
         self.progress_bar = ttk.Progressbar(self.progress_frame, orient="horizontal", length=100, mode="determinate")
         self.progress_bar.pack(fill="x")
-        
-        # Set initial state
+
+        # Fill in the description for the selected tool and flush any
+        # messages that arrived before the output area existed
         self.update_display()
-        
-        # Start polling queue for output messages
-        self.check_queue()
-    
+        if self._pending_output:
+            for message in self._pending_output:
+                self.print_to_output(message)
+            self._pending_output = []
+
     def apply_theme(self):
         """Apply dark theme colors to the UI elements"""
         # Configure colors for text widgets that need it
@@ -833,7 +1274,7 @@ for PlayStation 1, Dreamcast, PS2, and GameCube era games.
 Created by: RomRevival
 Support: {DONATION_URL}
 """
-        messagebox.showinfo("About Nex Tex Tools", about_text)
+        messagebox.showinfo("About Nex Tex Tools", about_text, parent=self.root)
     
     def browse_source(self):
         """Browse for source directory"""
@@ -850,259 +1291,315 @@ Support: {DONATION_URL}
     def update_display(self):
         """Update the description and input options based on the selected tool"""
         tool_num = self.selected_tool.get()
-        
-        # Update description text
-        self.description_text.config(state="normal")
-        self.description_text.delete('1.0', tk.END)
-        if tool_num in TOOL_DESCRIPTIONS:
-            self.description_text.insert('1.0', TOOL_DESCRIPTIONS[tool_num])
-        self.description_text.config(state="disabled")
-        
-        # Reset visibility
-        self.fill_color_frame.pack_forget()
-        
-        # Two directory inputs
-        if tool_num in ["1", "4", "8", "10"]:
-            self.source_dir_frame.pack(fill="x", pady=5)
+
+        # Re-clicking the already-selected tool changes nothing
+        if tool_num == self._cur_tool:
+            return
+
+        # Update description text (the pane may not be built yet; only
+        # record the tool once it exists so the post-build refresh runs)
+        if hasattr(self, "_desc_var"):
+            self._desc_var.set(TOOL_DESCRIPTIONS.get(tool_num, ""))
+            self._cur_tool = tool_num
+
+        # Re-packing the input frames forces Tk to redo geometry, so skip
+        # it entirely when the new tool uses the same layout as the last
+        key = _LAYOUTS.get(tool_num, "s")
+        if key == self._last_layout_key:
+            return
+        self._last_layout_key = key
+
+        self.source_dir_frame.pack(fill="x", pady=5)
+        if "d" in key:
             self.dest_dir_frame.pack(fill="x", pady=5)
-        # Single directory input
-        elif tool_num in ["2", "5", "6", "9"]:
-            self.source_dir_frame.pack(fill="x", pady=5)
-            self.dest_dir_frame.pack_forget()
-        # Fill transparent areas (needs color selection)
-        elif tool_num == "7":
-            self.source_dir_frame.pack(fill="x", pady=5)
+        else:
             self.dest_dir_frame.pack_forget()
+        if "c" in key:
             self.fill_color_frame.pack(fill="x", pady=5)
-        # Remove duplicate files (uses source/dest)
-        elif tool_num == "3":
-            self.source_dir_frame.pack(fill="x", pady=5)
-            self.dest_dir_frame.pack(fill="x", pady=5)
+        else:
+            self.fill_color_frame.pack_forget()
     
     def print_to_output(self, message):
         """Append text to the output area"""
+        self._append_output_lines([message])
+
+    def _append_output_lines(self, lines):
+        """
+        Append a batch of lines to the output area in one Text insert.
+        Each insert/see call is a Tcl round-trip, so coalescing a whole
+        queue drain into one call keeps the GUI cheap when tools emit
+        thousands of lines; the widget is capped at MAX_OUTPUT_LINES
+        with a single delete of the oldest overflow.
+        """
+        if not hasattr(self, "output_text"):
+            self._pending_output.extend(lines)
+            return
         self.output_text.config(state="normal")
-        self.output_text.insert(tk.END, message + '\n')
+        self.output_text.insert(tk.END, "\n".join(lines) + "\n")
+        self._out_lines += len(lines)
+        if self._out_lines > MAX_OUTPUT_LINES:
+            excess = self._out_lines - MAX_OUTPUT_LINES
+            self.output_text.delete('1.0', f'{excess + 1}.0')
+            self._out_lines = MAX_OUTPUT_LINES
         self.output_text.see(tk.END)
         self.output_text.config(state="disabled")
-    
+
     def clear_output(self):
         """Clear the output area"""
+        self._pending_output = []
+        self._out_lines = 0
+        if not hasattr(self, "output_text"):
+            return
         self.output_text.config(state="normal")
         self.output_text.delete('1.0', tk.END)
         self.output_text.config(state="disabled")
-    
+
+    def _drain_output(self):
+        """Flush queued worker messages into the widgets"""
+        # Drain everything first, then touch the widgets once: batching
+        # the inserts and keeping only the last progress value avoids a
+        # Tcl round-trip per message
+        info_lines = []
+        errors = []
+        latest_progress = None
+        busy_done = False
+        while output_queue:
+            message_type, message = output_queue.popleft()
+            if message_type == 'DONE':
+                info_lines.append("Operation completed successfully!")
+                latest_progress = 100
+            elif message_type == 'ERROR':
+                info_lines.append(f"Error: {message}")
+                errors.append(message)
+            elif message_type == 'INFO':
+                info_lines.append(message)
+            elif message_type == 'PROGRESS':
+                latest_progress = message
+            elif message_type == 'BUSY_DONE':
+                busy_done = True
+        if busy_done:
+            self._set_busy(False)
+        if info_lines:
+            self._append_output_lines(info_lines)
+        if latest_progress is not None and hasattr(self, "progress_bar"):
+            self.progress_bar["value"] = latest_progress
+        for message in errors:
+            messagebox.showerror("Error", f"An error occurred: {message}", parent=self.root)
+
     def check_queue(self):
-        """Check the output queue for messages from threads"""
+        """Safety-net poll in case a wakeup event is ever lost"""
+        self._drain_output()
+        self.root.after(1000, self.check_queue)
+
+    def _wake(self):
+        """Wake the Tk loop from a worker thread (safe to call cross-thread)"""
         try:
-            while True:
-                message_type, message = output_queue.get_nowait()
-                
-                if message_type == 'DONE':
-                    self.print_to_output("Operation completed successfully!")
-                    # Update the progress bar to 100%
-                    self.progress_bar["value"] = 100
-                elif message_type == 'ERROR':
-                    self.print_to_output(f"Error: {message}")
-                    messagebox.showerror("Error", f"An error occurred: {message}")
-                elif message_type == 'INFO':
-                    self.print_to_output(message)
-                elif message_type == 'PROGRESS':
-                    # Update progress bar
-                    self.progress_bar["value"] = message
-                
-                output_queue.task_done()
-        except queue.Empty:
+            self.root.event_generate("<<NttOutput>>", when="tail")
+        except tk.TclError:
+            pass  # window is closing; the safety-net poll is gone anyway
+
+    def _on_close(self):
+        """Stop any in-flight batch, tear down the pool and close"""
+        cancel_event.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
+    def _ensure_dir(self, path, label):
+        """
+        Make sure a directory exists, offering to create it if missing.
+
+        One os.stat covers the existence check, and makedirs(exist_ok=True)
+        avoids racing against anything that creates the directory between
+        check and create. Returns True if the directory is usable.
+        """
+        try:
+            os.stat(path)
+            return True
+        except FileNotFoundError:
             pass
-        
-        # Schedule next check
-        self.root.after(100, self.check_queue)
-    
+        except OSError as e:
+            # NotADirectoryError (a path component is a file) or
+            # PermissionError: surface it instead of letting the Tk
+            # button callback die silently on stderr
+            messagebox.showerror("Error", f"Cannot use {label.lower()} directory: {e}",
+                                 parent=self.root)
+            return False
+        if messagebox.askyesno("Directory Missing", f"{label} directory doesn't exist. Create it?",
+                              parent=self.root):
+            try:
+                os.makedirs(path, exist_ok=True)
+                self.print_to_output(f"Created {label.lower()} directory: {path}")
+                return True
+            except Exception as e:
+                messagebox.showerror("Error", f"Error creating directory: {e}", parent=self.root)
+        return False
+
+    def _set_busy(self, busy):
+        """Toggle the in-flight flag and the Run button state (Tk thread)"""
+        self._busy = busy
+        if hasattr(self, "_run_btn"):
+            self._run_btn.state(["disabled"] if busy else ["!disabled"])
+
     def run_selected_tool(self):
         """Run the selected tool with provided inputs"""
+        # Ignore clicks while an operation is already running
+        if self._busy:
+            return
+
         # Clear output
         self.clear_output()
-        
+
         # Reset progress bar
-        self.progress_bar["value"] = 0
+        if hasattr(self, "progress_bar"):
+            self.progress_bar["value"] = 0
         
-        # Get tool number
+        # Get tool number and which directories its layout calls for
         tool_num = self.selected_tool.get()
-        
-        # Setup function and arguments based on selected tool
-        function = None
-        args = []
-        kwargs = {}
-        
+        layout = _LAYOUTS.get(tool_num, "s")
+
         # Get directory paths
         source_dir = self.source_dir.get()
         dest_dir = self.dest_dir.get()
-        
+
         # Validate paths as needed
         if not source_dir:
-            messagebox.showerror("Error", "Please select a source directory")
+            messagebox.showerror("Error", "Please select a source directory", parent=self.root)
             return
-            
-        if tool_num in ["1", "3", "4", "8", "10"] and not dest_dir:
-            messagebox.showerror("Error", "Please select a destination directory")
+
+        if "d" in layout and not dest_dir:
+            messagebox.showerror("Error", "Please select a destination directory", parent=self.root)
             return
-        
-        if not os.path.exists(source_dir):
-            if messagebox.askyesno("Directory Missing", "Source directory doesn't exist. Create it?"):
-                try:
-                    os.makedirs(source_dir)
-                    self.print_to_output(f"Created source directory: {source_dir}")
-                except Exception as e:
-                    messagebox.showerror("Error", f"Error creating directory: {e}")
-                    return
-            else:
-                return
-        
-        if tool_num in ["1", "4", "8", "10"] and not os.path.exists(dest_dir):
-            # Create destination directory if needed
-            if messagebox.askyesno("Directory Missing", "Destination directory doesn't exist. Create it?"):
-                try:
-                    os.makedirs(dest_dir)
-                    self.print_to_output(f"Created destination directory: {dest_dir}")
-                except Exception as e:
-                    messagebox.showerror("Error", f"Error creating directory: {e}")
-                    return
-            else:
-                return
-        
-        # Set up the function call based on selected tool
-        if tool_num == "1":  # Move Images with Alpha Channel
-            function = move_alpha_pngs
-            args = [source_dir, dest_dir]
-        elif tool_num == "2":  # Flip Images Vertically
-            function = flip_images
-            args = [source_dir]
-        elif tool_num == "3":  # Remove Duplicate Files
-            # Special handling for deduplication
+
+        if not self._ensure_dir(source_dir, "Source"):
+            return
+
+        # Dedup validates and confirms its own directories
+        if tool_num == "3":
             self.run_deduplication(source_dir, dest_dir)
             return
-        elif tool_num == "4":  # Detect PS2 Textures
-            function = detect_ps2_alpha
-            args = [source_dir, dest_dir]
-        elif tool_num == "5":  # Make Alpha 128 Solid
-            function = lambda dir: process_directory_batch(dir, process_alpha, make_solid=True)
-            args = [source_dir]
-        elif tool_num == "6":  # Restore Alpha to 50%
-            function = lambda dir: process_directory_batch(dir, process_alpha, make_solid=False)
-            args = [source_dir]
-        elif tool_num == "7":  # Fill Transparent Areas
-            # Get the color selection
-            color_name = self.fill_color.get()
-            color_index = list(FILL_COLORS.keys())[['Magenta', 'Neon Green', 'Cyan', 'Hot Pink', 'Bright Yellow'].index(color_name)]
-            function = lambda dir: process_directory_batch(dir, fill_transparency, color_rgb=FILL_COLORS[color_index]['rgb'], restore=False)
-            args = [source_dir]
-        elif tool_num == "8":  # Find and Replace
-            function = find_and_replace
-            args = [source_dir, dest_dir]
-        elif tool_num == "9":  # BKP File Remover
-            function = remove_bkp_files
-            args = [source_dir]
-        elif tool_num == "10":  # Compare and Move
-            function = compare_and_move
-            args = [source_dir, dest_dir]
-        # Add new tool cases here
-        
-        # Redirect print output to GUI
-        original_print = print
-        def print_redirect(*args, **kwargs):
-            message = " ".join(map(str, args))
-            output_queue.put(('INFO', message))
-        
-        # Override built-in print
-        import builtins
-        builtins.print = print_redirect
-        
+
+        if "d" in layout and not self._ensure_dir(dest_dir, "Destination"):
+            return
+
+        function = _DISPATCH.get(tool_num)
+        if function is None:
+            return
+        args = [source_dir, dest_dir] if "d" in layout else [source_dir]
+        kwargs = {}
+        if "c" in layout:
+            kwargs['color_rgb'] = self._fill_color_lookup[self.fill_color.get()]
+
         # Start the operation in a thread
-        if function:
-            self.print_to_output(f"Starting operation...")
-            threading.Thread(target=self.long_operation_thread, 
-                           args=(function, args, kwargs), 
-                           daemon=True).start()
-    
+        self.print_to_output(f"Starting operation...")
+        self._set_busy(True)
+        self._executor.submit(self.long_operation_thread, function, args, kwargs)
+
     def long_operation_thread(self, function, args, kwargs):
         """Run operations in a separate thread to keep GUI responsive"""
         try:
             result = function(*args, **kwargs)
-            output_queue.put(('DONE', result))
+            _post('DONE', result)
         except Exception as e:
-            output_queue.put(('ERROR', str(e)))
-        
-        # Reset print after thread completes
-        import builtins
-        builtins.print = __builtins__.__dict__['print']
-    
+            _post('ERROR', str(e))
+        finally:
+            _post('BUSY_DONE', None)
+
     def run_deduplication(self, source_dir, dest_dir):
         """Special handler for deduplication which needs more interaction"""
+        # The path resolution and directory scan can take a while on big
+        # trees, so do them in a worker thread and hop back onto the Tk
+        # thread for the confirmation dialog
+        self._set_busy(True)
+        self._executor.submit(self._dedup_worker, source_dir, dest_dir)
+
+    def _dedup_worker(self, source_dir, dest_dir):
+        """Scan for duplicates off the Tk thread, then post the results back"""
         try:
             source_path = Path(source_dir).resolve()
             dest_path = Path(dest_dir).resolve()
-            
+
             if not source_path.exists() or not source_path.is_dir():
-                self.print_to_output("Invalid source directory")
+                _post('INFO', "Invalid source directory")
+                _post('BUSY_DONE', None)
                 return
-            
+
             if not dest_path.exists() or not dest_path.is_dir():
-                self.print_to_output("Invalid destination directory")
+                _post('INFO', "Invalid destination directory")
+                _post('BUSY_DONE', None)
                 return
-            
+
             duplicates = list_duplicate_files(source_path, dest_path)
-            
-            if not duplicates:
-                self.print_to_output("No duplicate filenames found. Nothing to delete.")
-                return
-            
-            # Show the duplicates
-            self.print_to_output("The following files will be deleted from the destination directory:")
-            for file in duplicates:
-                self.print_to_output(f"- {file.name}")
-            
-            # Ask for confirmation via a popup
-            if messagebox.askyesno("Confirm Deletion", 
-                               f"Are you sure you want to delete these {len(duplicates)} files from {dest_dir}?"):
-                
-                # Process deletions in a thread
-                threading.Thread(target=self.process_deletions_thread, 
-                               args=(duplicates,), 
-                               daemon=True).start()
-            else:
-                self.print_to_output("Operation cancelled.")
-        
+
+            # Confirmation dialog has to run on the Tk thread
+            self.root.after(0, self._dedup_found, duplicates, dest_dir)
+
         except Exception as e:
-            self.print_to_output(f"Error: {str(e)}")
+            _post('INFO', f"Error: {str(e)}")
+            _post('BUSY_DONE', None)
+
+    def _dedup_found(self, duplicates, dest_dir):
+        """Show the scan results and ask for confirmation (Tk thread)"""
+        if not duplicates:
+            self.print_to_output("No duplicate filenames found. Nothing to delete.")
+            self._set_busy(False)
+            return
+
+        # Show the duplicates
+        self.print_to_output("The following files will be deleted from the destination directory:")
+        for file in duplicates:
+            self.print_to_output(f"- {file.name}")
+
+        # Ask for confirmation via a popup
+        if messagebox.askyesno("Confirm Deletion",
+                           f"Are you sure you want to delete these {len(duplicates)} files from {dest_dir}?",
+                           parent=self.root):
+
+            # Process deletions in a thread
+            self._executor.submit(self.process_deletions_thread, duplicates)
+        else:
+            self.print_to_output("Operation cancelled.")
+            self._set_busy(False)
     
     def process_deletions_thread(self, duplicates):
         """Process file deletions in a separate thread"""
         deleted = 0
         errors = []
-        
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            def delete_file(file):
-                try:
-                    file.unlink()
-                    return True, None
-                except Exception as e:
-                    return False, (file.name, str(e))
-            
-            results = list(executor.map(delete_file, duplicates))
-            
-        for success, error in results:
-            if success:
-                deleted += 1
-            elif error:
-                errors.append(error)
-        
+
+        def delete_file(file):
+            try:
+                file.unlink()
+                return True, None
+            except Exception as e:
+                return False, (file.name, str(e))
+
+        def tally(results):
+            nonlocal deleted
+            # Stream results as they come in and report progress as we go
+            for i, (success, error) in enumerate(results):
+                if success:
+                    deleted += 1
+                elif error:
+                    errors.append(error)
+                if i % 50 == 0:
+                    _post('PROGRESS', 100 * i / len(duplicates))
+
+        # A pool only pays off on big lists; unlinking a handful of files
+        # is faster done right here in this worker thread
+        if len(duplicates) < 64:
+            tally(map(delete_file, duplicates))
+        else:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                tally(executor.map(delete_file, duplicates))
+
         # Update the UI with results
-        output_queue.put(('INFO', f"Operation completed: {deleted} file(s) deleted successfully"))
+        _post('INFO', f"Operation completed: {deleted} file(s) deleted successfully")
         
         if errors:
-            output_queue.put(('INFO', f"{len(errors)} error(s) occurred:"))
+            _post('INFO', f"{len(errors)} error(s) occurred:")
             for filename, error in errors:
-                output_queue.put(('INFO', f"  - Failed to delete '{filename}': {error}"))
+                _post('INFO', f"  - Failed to delete '{filename}': {error}")
+
+        _post('BUSY_DONE', None)
 
 #==============================================================================
 # PROGRAM ENTRY POINT